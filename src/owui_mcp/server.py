@@ -13,6 +13,8 @@ import inspect
 import logging
 import os
 import sys
+from collections.abc import Iterator
+from typing import Any
 
 from fastmcp import FastMCP
 
@@ -49,6 +51,47 @@ def parse_args(argv: list[str] | None = None) -> argparse.Namespace:
     return parser.parse_args(argv)
 
 
+def _is_coroutine_function(obj: Any) -> bool:
+    """Return True if *obj* is a plain ``async def`` function.
+
+    Tests the ``CO_COROUTINE`` code flag directly. Discovery only sees raw
+    class attributes, so the unwrapping done by
+    ``inspect.iscoroutinefunction`` is not needed. Async generators are
+    excluded.
+    """
+    code = getattr(obj, "__code__", None)
+    return code is not None and bool(code.co_flags & inspect.CO_COROUTINE)
+
+
+def _iter_routers(client: OpenWebUI) -> Iterator[tuple[str, ResourceBase]]:
+    """Yield ``(name, router)`` for each resource client attached to *client*.
+
+    Walks the instance ``__dict__`` rather than ``dir()`` so that inherited
+    attributes and properties are never looked up.
+    """
+    for name, router in sorted(vars(client).items(), key=lambda item: item[0]):
+        if not name.startswith("_") and isinstance(router, ResourceBase):
+            yield name, router
+
+
+def _iter_router_methods(router: ResourceBase) -> Iterator[tuple[str, Any]]:
+    """Yield ``(name, bound_method)`` for each public coroutine method of *router*.
+
+    Only functions declared on the router's classes are inspected, and only
+    coroutine functions are bound, so no other descriptor is ever invoked.
+    """
+    attrs: dict[str, Any] = {}
+    for cls in reversed(type(router).__mro__):
+        attrs.update(vars(cls))
+
+    for name in sorted(attrs):
+        if name.startswith("_"):
+            continue
+        if not _is_coroutine_function(attrs[name]):
+            continue
+        yield name, getattr(router, name)
+
+
 def create_server(code_mode: bool = False) -> FastMCP:
     """Build and return a configured FastMCP server."""
     api_url = os.environ.get("OWUI_API_URL", "http://127.0.0.1:8080/api")
@@ -86,22 +129,8 @@ def create_server(code_mode: bool = False) -> FastMCP:
     mcp = FastMCP("owui_mcp", version=__version__, transforms=transforms)
 
     tool_count = 0
-    for router_name in sorted(dir(client)):
-        if router_name.startswith("_"):
-            continue
-        router = getattr(client, router_name, None)
-        if not isinstance(router, ResourceBase):
-            continue
-
-        for method_name in sorted(dir(router)):
-            if method_name.startswith("_"):
-                continue
-            method = getattr(router, method_name, None)
-            
-            # Use inspect.iscoroutinefunction for Python 3.14+ compatibility
-            if method is None or not inspect.iscoroutinefunction(method):
-                continue
-
+    for router_name, router in _iter_routers(client):
+        for method_name, method in _iter_router_methods(router):
             tool_name = f"{router_name}__{method_name}"
 
             try:
@@ -111,10 +140,19 @@ def create_server(code_mode: bool = False) -> FastMCP:
                 mcp.tool(name=tool_name, description=description)(method)
                 tool_count += 1
 
-            except Exception:
-                logger.warning(
-                    "Skipping tool %s — registration failed", tool_name, exc_info=True
-                )
+            except Exception as exc:
+                # Tracebacks are only worth formatting when debugging; a client
+                # with many unsupported signatures would otherwise stall startup.
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "Skipping tool %s — registration failed", tool_name, exc_info=True
+                    )
+                else:
+                    logger.warning(
+                        "Skipping tool %s — registration failed (%s)",
+                        tool_name,
+                        type(exc).__name__,
+                    )
 
     logger.info("Discovered %d tools from owui_client", tool_count)
     return mcp
@@ -1,3 +1,4 @@
+import logging
 import os
 import subprocess
 import sys
@@ -39,6 +40,53 @@ def test_create_server_with_code_mode_has_transform():
     assert any(isinstance(t, CodeMode) for t in transforms)
 
 
+def test_iter_routers_yields_public_resource_clients_only():
+    from owui_client import OpenWebUI
+    from owui_mcp.server import _iter_router_methods, _iter_routers
+
+    client = OpenWebUI(api_url="http://localhost/api")
+    routers = dict(_iter_routers(client))
+
+    assert "chats" in routers
+    assert "shortcuts" not in routers
+    assert all(not name.startswith("_") for name in routers)
+
+    methods = dict(_iter_router_methods(routers["chats"]))
+    assert "_request" not in methods
+    assert methods and all(m.__self__ is routers["chats"] for m in methods.values())
+
+
+def test_is_coroutine_function_matches_async_def_only():
+    from owui_mcp.server import _is_coroutine_function
+
+    async def coro():
+        pass
+
+    async def agen():
+        yield
+
+    def func():
+        pass
+
+    assert _is_coroutine_function(coro)
+    assert not _is_coroutine_function(agen)
+    assert not _is_coroutine_function(func)
+    assert not _is_coroutine_function(property(func))
+
+
+def test_registration_failure_logs_without_traceback(caplog):
+    from owui_mcp.server import create_server
+
+    with patch("owui_mcp.server.FastMCP.tool", side_effect=ValueError("boom")):
+        with caplog.at_level(logging.INFO, logger="owui_mcp"):
+            create_server(code_mode=False)
+
+    skipped = [r for r in caplog.records if "Skipping tool" in r.getMessage()]
+    assert skipped
+    assert all(r.levelno == logging.WARNING and r.exc_info is None for r in skipped)
+    assert "ValueError" in skipped[0].getMessage()
+
+
 def test_help_works_without_env_vars():
     env = {k: v for k, v in os.environ.items() if k not in ("OWUI_API_URL", "OWUI_API_KEY")}
     result = subprocess.run(